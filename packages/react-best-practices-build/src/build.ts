@@ -143,16 +143,21 @@ async function buildSkill(skillConfig: SkillConfig) {
     .filter((f) => f.endsWith('.md') && !f.startsWith('_') && f !== 'README.md')
     .sort() // Sort filenames for consistent ordering across systems
 
-  const ruleData: RuleFile[] = []
-  for (const file of ruleFiles) {
-    const filePath = join(skillConfig.rulesDir, file)
-    try {
-      const parsed = await parseRuleFile(filePath, skillConfig.sectionMap)
-      ruleData.push(parsed)
-    } catch (error) {
-      console.error(`  Error parsing ${file}:`, error)
-    }
-  }
+  // Read and parse rule files concurrently; results keep the sorted file order
+  const parsedFiles = await Promise.all(
+    ruleFiles.map(async (file) => {
+      const filePath = join(skillConfig.rulesDir, file)
+      try {
+        return await parseRuleFile(filePath, skillConfig.sectionMap)
+      } catch (error) {
+        console.error(`  Error parsing ${file}:`, error)
+        return null
+      }
+    })
+  )
+  const ruleData: RuleFile[] = parsedFiles.filter(
+    (parsed): parsed is RuleFile => parsed !== null
+  )
 
   // Group rules by section
   const sectionsMap = new Map<number, Section>()